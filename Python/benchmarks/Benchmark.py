@@ -0,0 +1,275 @@
+"""
+Benchmark harness for the algorithms in this package.
+
+Every benchmark is registered with the sizes it should be run with (bit lengths, sieve bounds,
+group orders, permutation lengths or PPRF value counts). The results are written as JSON and can
+be compared against a stored baseline to spot regressions. Everything runs offline.
+
+Usage (from the repository root):
+
+    python -m Python.benchmarks.Benchmark run --output baseline.json
+    python -m Python.benchmarks.Benchmark run --output current.json --benchmark sieve_of_eratosthenes
+    python -m Python.benchmarks.Benchmark compare baseline.json current.json --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+
+from ..discreteMath.SquareAndMultiply import square_and_multiply
+from ..discreteMath.SieveOfEratosthenes import sieve_of_eratosthenes
+from ..discreteMath.ExtendedEuklidianAlgorithm import extended_euklidian_algorithm
+from ..discreteMath.ChineseRemainderTheorem import ChineseRemainderTheorem
+from ..discreteMath.DiscreteMathTools import allPerms
+
+# all random inputs are drawn from generators with this seed so runs are comparable
+SEED = 20191201
+
+# name -> (setup function, sizes, calls per timing, maximal calls per size)
+BENCHMARKS = dict()
+
+
+def benchmark(name, sizes, number, max_calls=None):
+    """
+    Decorator that registers a benchmark setup function under name.
+
+    The setup function is called once per size with the size and a seeded random generator and
+    has to return a function without arguments. Only that returned function is timed.
+
+    Arguments:
+            name: The name the benchmark is reported under (str)
+            sizes: The input sizes the benchmark is run with (list of int)
+            number: How often the returned function is called per timing (int)
+            max_calls: Function that gets a size and returns how often the function returned by setup
+                       can be called at most. Unlimited if None (function)
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, sizes, number, max_calls)
+        return setup
+    return register
+
+
+@benchmark("square_and_multiply", sizes=[256, 512, 1024, 2048], number=10)
+def bench_square_and_multiply(bits, rng):
+    modulo = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+    base = rng.randrange(2, modulo)
+    exponent = rng.getrandbits(bits) | (1 << (bits - 1))
+    return lambda: square_and_multiply(base, modulo, exponent)
+
+
+@benchmark("sieve_of_eratosthenes", sizes=[10**4, 10**5, 10**6], number=1)
+def bench_sieve_of_eratosthenes(bound, rng):
+    return lambda: sieve_of_eratosthenes(bound)
+
+
+@benchmark("extended_euklidian_algorithm", sizes=[256, 1024, 4096], number=100)
+def bench_extended_euklidian_algorithm(bits, rng):
+    a = rng.getrandbits(bits) | (1 << (bits - 1))
+    b = rng.getrandbits(bits) | (1 << (bits - 1))
+    return lambda: extended_euklidian_algorithm(a, b)
+
+
+@benchmark("ChineseRemainderTheorem", sizes=[8, 64, 256], number=10)
+def bench_chinese_remainder_theorem(moduli, rng):
+    # distinct primes are pairwise coprime
+    m = sieve_of_eratosthenes(20000)[-moduli:]
+    a = [rng.randrange(0, mi) for mi in m]
+    return lambda: ChineseRemainderTheorem(a, m)
+
+
+@benchmark("BabyStepGiantStep", sizes=[10007, 1000003, 100000007], number=1)
+def bench_baby_step_giant_step(order, rng):
+    from ..groups.Groups import MultModGroup
+    from ..groups.BabyStepGiantStep import BabyStepGiantStep
+
+    # the sizes are primes, so the group has order - 1 elements
+    group = MultModGroup(order)
+    a = rng.randrange(2, order)
+    b = group.exp(a, rng.randrange(1, order - 1))
+    return lambda: BabyStepGiantStep(group, a, b)
+
+
+@benchmark("DiscreteLogSolver.solve", sizes=[10007, 1000003, 100000007], number=10)
+def bench_discrete_log_solver_solve(order, rng):
+    from ..groups.Groups import MultModGroup
+    from ..groups.DiscreteLogSolver import DiscreteLogSolver
+
+    group = MultModGroup(order)
+    a = rng.randrange(2, order)
+    # the table is built once, only the giant steps are timed
+    solver = DiscreteLogSolver(group, a)
+    b = group.exp(a, rng.randrange(1, order - 1))
+    return lambda: solver.solve(b)
+
+
+@benchmark("allPerms", sizes=[6, 7, 8], number=1)
+def bench_all_perms(length, rng):
+    values = list(range(length))
+    def run():
+        for perm in allPerms(values):
+            pass
+    return run
+
+
+def _outer_pprf(values):
+    from ..pprf.PPRF import OuterPPRF
+    return OuterPPRF(2048, values)
+
+
+@benchmark("OuterPPRF.evaluate", sizes=[232, 464, 928], number=5)
+def bench_outer_pprf_evaluate(values, rng):
+    pprf = _outer_pprf(values)
+    x = rng.randrange(0, values)
+    return lambda: pprf.evaluate(x)
+
+
+@benchmark("InnerPPRF.evaluate_batch", sizes=[1, 8, 64, 231], number=5)
+def bench_inner_pprf_evaluate_batch(batch, rng):
+    inner = _outer_pprf(232).innerPPRFs[0]
+    xs = rng.sample(range(232), batch)
+    return lambda: inner.evaluate_batch(xs)
+
+
+@benchmark("OuterPPRF.puncture", sizes=[232, 464, 928], number=10, max_calls=lambda values: values)
+def bench_outer_pprf_puncture(values, rng):
+    pprf = _outer_pprf(values)
+    # every call punctures a fresh value, punctured values would return right away
+    xs = iter(rng.sample(range(values), values))
+    return lambda: pprf.puncture(next(xs))
+
+
+def run_benchmarks(names=None, repeat=5):
+    """
+    Runs the registered benchmarks and returns their results.
+
+    returns: A dict that can be dumped as JSON. Timings are seconds per call.
+
+    arguments:
+            names: The benchmarks to run. Runs all benchmarks if None (iterable of str)
+            repeat: How often every benchmark is timed. The minimum is the most stable value (int)
+
+    Exception:
+            ValueError: Should one of the names not be a registered benchmark or should repeat
+                        need more calls than a benchmark allows
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError("Unknown benchmark " + str(name))
+        setup, sizes, number, max_calls = BENCHMARKS[name]
+        if max_calls is not None:
+            for size in sizes:
+                if repeat * number > max_calls(size):
+                    raise ValueError("%s[%s] allows at most %d calls, repeat %d needs %d"
+                                     % (name, size, max_calls(size), repeat, repeat * number))
+
+    results = dict()
+    for name in names:
+        setup, sizes, number, max_calls = BENCHMARKS[name]
+        results[name] = dict()
+        for size in sizes:
+            function = setup(size, random.Random(SEED))
+            timings = timeit.Timer(function).repeat(repeat=repeat, number=number)
+            timings = [t / number for t in timings]
+            # JSON only knows string keys, so we use them right away
+            results[name][str(size)] = {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.mean(timings),
+                "number": number,
+                "repeat": repeat,
+            }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.1):
+    """
+    Compares two results of run_benchmarks. Only benchmarks and sizes that are part of both are compared.
+
+    returns: A list of tuples (name, size, baseline seconds, current seconds, ratio) for every
+            benchmark that got slower by more than threshold
+
+    arguments:
+            baseline: The stored results to compare against (dict)
+            current: The new results (dict)
+            threshold: Relative slowdown that is still tolerated. 0.1 allows 10% (float)
+
+    Exception:
+            ValueError: Should a timing of the baseline not be positive
+    """
+    regressions = []
+    for name, sizes in current["results"].items():
+        for size, timing in sizes.items():
+            try:
+                old = baseline["results"][name][size]["min"]
+            except KeyError:
+                continue
+            if not old > 0:
+                raise ValueError("baseline timing of %s[%s] is not positive: %r" % (name, size, old))
+            ratio = timing["min"] / old
+            if ratio > 1 + threshold:
+                regressions.append((name, size, old, timing["min"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the algorithms of this package.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run benchmarks and write the results as JSON")
+    run.add_argument("--output", "-o", help="file to write the results to, defaults to stdout")
+    run.add_argument("--benchmark", "-b", action="append", choices=sorted(BENCHMARKS),
+                     help="benchmark to run, can be given multiple times, defaults to all")
+    run.add_argument("--repeat", "-r", type=int, default=5, help="timings per benchmark and size")
+
+    compare = subparsers.add_parser("compare", help="compare results against a baseline")
+    compare.add_argument("baseline", help="JSON file with the baseline results")
+    compare.add_argument("current", help="JSON file with the new results")
+    compare.add_argument("--threshold", "-t", type=float, default=0.1,
+                         help="tolerated relative slowdown, defaults to 0.1")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        try:
+            results = run_benchmarks(args.benchmark, args.repeat)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        else:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    try:
+        regressions = compare_results(baseline, current, args.threshold)
+    except ValueError as e:
+        parser.error(str(e))
+    for name, size, old, new, ratio in regressions:
+        print("REGRESSION %s[%s]: %.6fs -> %.6fs (x%.2f)" % (name, size, old, new, ratio))
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+from .ExtendedEuklidianAlgorithm import inverse_modulo
+
 def ChineseRemainderTheorem(a,m):
     """
     Calculates x such that x=a[i] mod m[i] for all i<len(min(a,m)) using the chinese remainder theorem.
@@ -28,7 +30,7 @@ def ChineseRemainderTheorem(a,m):
     for i in range(length):
         M = M * m[i]
     for i in range(length):
-        Mlist.append(M/m[i])
+        Mlist.append(M//m[i])
 
         # Calculate the Inverse N_i of M_i mod m_i which we know must exist as M_i is co-prime to m_i
         Nlist.append(inverse_modulo(Mlist[i],m[i]))
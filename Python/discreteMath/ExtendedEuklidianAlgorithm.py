@@ -1,3 +1,6 @@
+from .Instrumentation import instrumented, bit_size
+
+
 def extended_euklidian_algorithm(a, b):
     """Calculates the greatest common divisor of a and b and s and t of the
      formula ggT(a,b) = s*a+b*t with the extended euklidian algorithm
@@ -57,6 +60,7 @@ def extended_euklidian_algorithm(a, b):
     # return ggt(a,b) and a tuple (s,t) such that ggT = s*a+t*b mind that a>b!
     return (ggt, (table[0][3], table[0][4]))
 
+@instrumented("inverse_modulo", lambda a, p: bit_size(p))
 def inverse_modulo(a, p):
     """
     Calculates the inverse of a regarding modulo p with the extended extended
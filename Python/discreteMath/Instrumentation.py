@@ -0,0 +1,159 @@
+import functools
+import threading
+import time
+
+# upper bounds of the bit size histogram buckets, the last bucket catches everything bigger
+BIT_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+def bit_size(*values):
+    """
+    Returns the bit length of the biggest integer in values. Tuples (e.g. points of an elliptic
+    curve) are searched for integers as well, everything else counts as 0 bits.
+    """
+    bits = 0
+    for value in values:
+        if isinstance(value, int):
+            bits = max(bits, abs(value).bit_length())
+        elif isinstance(value, tuple):
+            bits = max(bits, bit_size(*value))
+    return bits
+
+
+class InstrumentationRegistry:
+    """
+    Collects call counts, total time and operand bit sizes per operation.
+
+    Recording only happens while enabled is True. Code that records into a registry is expected to
+    check enabled itself before doing any measurements, so a disabled registry costs one attribute lookup.
+    Recording is thread safe, as the instrumented functions may run in executor threads.
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Creates an empty registry.
+
+        Arguments:
+            enabled: Whether the registry records right away (bool)
+        """
+        self.enabled = enabled
+        self.stats = dict()
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds, bits):
+        """
+        Records one call of the operation name.
+
+        Arguments:
+            name: The name of the operation (str)
+            seconds: The time the call took (float)
+            bits: The bit size of the biggest operand of the call (int)
+        """
+        for bucket in range(len(BIT_BUCKETS)):
+            if bits <= BIT_BUCKETS[bucket]:
+                break
+        else:
+            bucket = len(BIT_BUCKETS)
+        with self.lock:
+            try:
+                stat = self.stats[name]
+            except KeyError:
+                stat = self.stats[name] = {
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "bits_sum": 0,
+                    "bits_max": 0,
+                    "bits_buckets": [0] * (len(BIT_BUCKETS) + 1),
+                }
+            stat["calls"] += 1
+            stat["seconds"] += seconds
+            stat["bits_sum"] += bits
+            if bits > stat["bits_max"]:
+                stat["bits_max"] = bits
+            stat["bits_buckets"][bucket] += 1
+
+    def reset(self):
+        """
+        Removes all recorded values.
+        """
+        with self.lock:
+            self.stats = dict()
+
+    def as_dict(self):
+        """
+        returns: A copy of the recorded values as a dict of operation name to its values (dict)
+        """
+        ret = dict()
+        with self.lock:
+            for name, stat in self.stats.items():
+                ret[name] = dict(stat)
+                ret[name]["bits_buckets"] = list(stat["bits_buckets"])
+        return ret
+
+    def to_prometheus(self, prefix="dediscord"):
+        """
+        Returns the recorded values in the Prometheus text exposition format. The bit sizes are
+        exported as a histogram.
+
+        Arguments:
+            prefix: The prefix of all metric names (str)
+        """
+        calls = ["# TYPE %s_calls_total counter" % prefix]
+        seconds = ["# TYPE %s_seconds_total counter" % prefix]
+        bits = ["# TYPE %s_operand_bits histogram" % prefix]
+        # work on a copy so concurrent recording does not change the values while they are written
+        stats = self.as_dict()
+        for name in sorted(stats):
+            stat = stats[name]
+            label = 'op="%s"' % name
+            calls.append("%s_calls_total{%s} %d" % (prefix, label, stat["calls"]))
+            seconds.append("%s_seconds_total{%s} %r" % (prefix, label, stat["seconds"]))
+            # prometheus histogram buckets are cumulative
+            cumulative = 0
+            for i in range(len(BIT_BUCKETS)):
+                cumulative += stat["bits_buckets"][i]
+                bits.append('%s_operand_bits_bucket{%s,le="%d"} %d' % (prefix, label, BIT_BUCKETS[i], cumulative))
+            bits.append('%s_operand_bits_bucket{%s,le="+Inf"} %d' % (prefix, label, stat["calls"]))
+            bits.append("%s_operand_bits_sum{%s} %d" % (prefix, label, stat["bits_sum"]))
+            bits.append("%s_operand_bits_count{%s} %d" % (prefix, label, stat["calls"]))
+        return "\n".join(calls + seconds + bits) + "\n"
+
+
+# the registry all instrumented discreteMath primitives record into
+registry = InstrumentationRegistry()
+
+
+def enable_instrumentation():
+    """
+    Starts recording calls of the instrumented discreteMath primitives into registry.
+    """
+    registry.enabled = True
+
+
+def disable_instrumentation():
+    """
+    Stops recording calls of the instrumented discreteMath primitives. Recorded values are kept.
+    """
+    registry.enabled = False
+
+
+def instrumented(name, bits):
+    """
+    Decorator that records every call of the decorated function into registry while it is enabled.
+
+    Arguments:
+        name: The name the calls are recorded under (str)
+        bits: Function that gets the arguments of a call and returns the recorded bit size (function)
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                registry.record(name, time.perf_counter() - start, bits(*args, **kwargs))
+        return wrapper
+    return decorator
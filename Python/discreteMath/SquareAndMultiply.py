@@ -1,3 +1,7 @@
+from .Instrumentation import instrumented, bit_size
+
+
+@instrumented("square_and_multiply", lambda base, modulo, exponent, verbose=False: bit_size(modulo))
 def square_and_multiply(base, modulo, exponent, verbose = False):
     """ Calculates base^(exponent) mod modulo (g^e) mod p with the shift and multiply algorithm.
 
@@ -1,4 +1,5 @@
 from .ChineseRemainderTheorem import *
 from .DiscreteMathTools import *
 from .ExtendedEuklidianAlgorithm import *
+from .Instrumentation import *
 from .SquareAndMultiply import *
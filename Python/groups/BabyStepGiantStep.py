@@ -1,4 +1,4 @@
-import math
+from .DiscreteLogSolver import DiscreteLogSolver
 
 def BabyStepGiantStep(group, a, b):
     """
@@ -7,32 +7,15 @@ def BabyStepGiantStep(group, a, b):
     algorithm has a runtime of O(sqrt(g)) and calculats x
     such that a^x = b in the given group.
 
-    returns: x, such that a^x = b in the given group
+    returns: x, such that a^x = b in the given group or None should there be no such x
 
     arguments:
             a: The base of a^x = b
             b: The result of a^x = b
             group: The group in which the result will be calculated
     """
-    order = group.order()
-    # we calculate the square root of the order of the group to 
-    # balance time complexity against space complexity
-    m = int(math.ceil(math.sqrt(order)))
-    table = dict()
-    # save the first sqrt(order) members of the group together with their exponents
-    for j in range(0,m):
-        exponent = group.exp(a,j)
-        table[exponent] = j
-    # take steps of size sqrt(order) to not be able to miss our sqrt(order) pre-calcuated elements
-    stepsizemult = group.exp(a,group.inv(m))
-    foot = b
-    # with our foot (element) we take steps of size sqrt(order) until we find one of the precalculated elements
-    # from there we can recalculate the original x such that a^x=b
-    for i in range(0,m):
-        try:
-            return table[foot]
-        except KeyError:
-            foot = group.op(foot,stepsizemult)
+    # a solver that is only used once, use DiscreteLogSolver directly to reuse the baby steps
+    return DiscreteLogSolver(group, a).solve(b)
 
 def BSGS(group,a,b):
     return BabyStepGiantStep(group,a,b)
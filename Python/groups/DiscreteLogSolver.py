@@ -0,0 +1,288 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+
+# magic, version, fingerprint of group and base, bytes per key, number of entries, m
+TABLE_HEADER = struct.Struct(">4sB32sIQQ")
+TABLE_MAGIC = b"BSGS"
+TABLE_VERSION = 2
+# the exponent j of every entry
+TABLE_VALUE = struct.Struct(">Q")
+
+
+class MappedBabyStepTable:
+    """
+    A baby-step table that was saved by DiscreteLogSolver.save and is read with mmap. The entries
+    are sorted by their key, so a lookup is a binary search and the table is never fully loaded.
+    Only works for groups whose elements are non-negative integers.
+    """
+
+    def __init__(self, path):
+        """
+        Maps the table file at path.
+
+        Arguments:
+            path: The file written by DiscreteLogSolver.save (str)
+
+        Exception:
+            ValueError: Should the file not be a baby-step table
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < TABLE_HEADER.size:
+            self.mm.close()
+            raise ValueError("file is not a baby-step table")
+        magic, version, self.fingerprint, self.key_width, self.count, self.m = TABLE_HEADER.unpack_from(self.mm, 0)
+        self.record_width = self.key_width + TABLE_VALUE.size
+        if magic != TABLE_MAGIC or version != TABLE_VERSION \
+                or len(self.mm) != TABLE_HEADER.size + self.count * self.record_width:
+            self.mm.close()
+            raise ValueError("file is not a baby-step table")
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        # the keys of the records, which lets bisect search the mapped file directly
+        offset = TABLE_HEADER.size + index * self.record_width
+        return self.mm[offset:offset + self.key_width]
+
+    def get(self, element, default=None):
+        """
+        Returns the exponent j of element or default should element not be part of the table.
+        """
+        if not isinstance(element, int) or element < 0 or element.bit_length() > 8 * self.key_width:
+            return default
+        key = element.to_bytes(self.key_width, "big")
+        index = bisect_left(self, key)
+        if index == self.count or self[index] != key:
+            return default
+        offset = TABLE_HEADER.size + index * self.record_width + self.key_width
+        return TABLE_VALUE.unpack_from(self.mm, offset)[0]
+
+    def nbytes(self):
+        """
+        Returns the size of the mapped file.
+        """
+        return len(self.mm)
+
+    def close(self):
+        self.mm.close()
+
+
+def table_fingerprint(group, a):
+    """
+    Returns a hash of the group class, the group parameters and the base a. It is saved with a
+    baby-step table so a table can not be loaded for a different group or base. Groups that do not
+    overwrite params only match themselves.
+    """
+    cls = type(group)
+    description = repr((cls.__module__, cls.__qualname__, group.params(), group.normalize(a)))
+    return hashlib.sha256(description.encode()).digest()
+
+
+class DiscreteLogSolver:
+    """
+    Solves the discrete logarithm problem a^x = b for a fixed a in a group that extends the
+    AbstGroup class with the baby-step giant-step algorithm. The table of the sqrt(order) baby steps
+    is built once, so every solve only has to take the giant steps.
+    """
+
+    def __init__(self, group, a, table=None):
+        """
+        Builds the baby-step table of a in group.
+
+        Arguments:
+            group: The group in which the logarithms will be calculated
+            a: The base of a^x = b
+            table: A prepared table that maps a^j to j for all 0 <= j < m, e.g. a MappedBabyStepTable.
+                   Will be built if None
+        """
+        self.group = group
+        self.a = a
+        # we calculate the square root of the order of the group to
+        # balance time complexity against space complexity
+        self.m = int(math.ceil(math.sqrt(group.order())))
+        if table is None:
+            table = dict()
+            element = group.neutral_element
+            # save the first sqrt(order) members of the group together with their exponents
+            # the smallest exponent wins should a have a smaller order than m
+            for j in range(self.m):
+                if element not in table:
+                    table[element] = j
+                element = group.op(element, a)
+        self.table = table
+        # a^(-m) is the size of one giant step
+        self.step = group.inv(group.exp(a, self.m))
+
+    def solve(self, b):
+        """
+        returns: x, such that a^x = b in the group or None should there be no such x
+
+        arguments:
+                b: The result of a^x = b
+        """
+        m = self.m
+        table = self.table
+        op = self.group.op
+        step = self.step
+        foot = b
+        # with our foot (element) we take steps of size sqrt(order) until we find one of the precalculated elements
+        # from there we can recalculate the original x such that a^x=b
+        for i in range(m):
+            j = table.get(foot)
+            if j is not None:
+                return i * m + j
+            foot = op(foot, step)
+        return None
+
+    def nbytes(self):
+        """
+        Returns an estimate of the memory used by the baby-step table in bytes.
+        """
+        try:
+            return self._nbytes
+        except AttributeError:
+            pass
+        if isinstance(self.table, dict):
+            size = sys.getsizeof(self.table)
+            for element, j in self.table.items():
+                size += sys.getsizeof(element) + sys.getsizeof(j)
+        else:
+            size = self.table.nbytes()
+        self._nbytes = size
+        return size
+
+    def save(self, path):
+        """
+        Saves the baby-step table as a sorted array to path, which can be read with load. A table
+        that was loaded is copied as it is.
+
+        Arguments:
+            path: The file to write to (str)
+
+        Exception:
+            ValueError: Should the elements of the group not be non-negative integers
+        """
+        if isinstance(self.table, MappedBabyStepTable):
+            # the mapped file already is the saved table, writing it onto itself would truncate it
+            if os.path.exists(path) and os.path.samefile(path, self.table.path):
+                return
+            with open(path, "wb") as f:
+                f.write(self.table.mm)
+            return
+        if any(not isinstance(element, int) or element < 0 for element in self.table):
+            raise ValueError("only tables of non-negative integer elements can be saved")
+        key_width = max((max(self.table, default=0).bit_length() + 7) // 8, 1)
+        with open(path, "wb") as f:
+            f.write(TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, table_fingerprint(self.group, self.a),
+                                      key_width, len(self.table), self.m))
+            # big endian keys of equal width sort the same as the integers
+            for element in sorted(self.table):
+                f.write(element.to_bytes(key_width, "big"))
+                f.write(TABLE_VALUE.pack(self.table[element]))
+
+    @classmethod
+    def load(cls, group, a, path):
+        """
+        Creates a solver whose baby-step table is mapped from a file written by save.
+
+        Arguments:
+            group: The group the table was built in
+            a: The base the table was built for
+            path: The file to read (str)
+
+        Exception:
+            ValueError: Should the file not be a table or have been built for a different group or base
+        """
+        table = MappedBabyStepTable(path)
+        if table.fingerprint != table_fingerprint(group, a):
+            table.close()
+            raise ValueError("table was built for a different group or base")
+        if table.m != int(math.ceil(math.sqrt(group.order()))):
+            table.close()
+            raise ValueError("table was built for a group of a different order")
+        return cls(group, a, table)
+
+
+class DiscreteLogSolverCache:
+    """
+    A least recently used cache of DiscreteLogSolvers keyed by the group parameters and the base a.
+    Solvers are evicted once the estimated size of all tables exceeds max_bytes. The cache can be
+    shared between threads.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Creates an empty cache.
+
+        Arguments:
+            max_bytes: The memory the baby-step tables may use together. The most recently used
+                       solver is kept even if it alone is bigger (int)
+        """
+        self.max_bytes = max_bytes
+        self.solvers = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.solvers)
+
+    def get(self, group, a):
+        """
+        Returns the solver for a in group and builds it should it not be cached.
+        """
+        a = group.normalize(a)
+        key = (type(group), group.params(), a)
+        with self.lock:
+            try:
+                self.solvers.move_to_end(key)
+                return self.solvers[key]
+            except KeyError:
+                pass
+        # the table is built without holding the lock, so other keys are not blocked meanwhile
+        solver = DiscreteLogSolver(group, a)
+        size = solver.nbytes()
+        with self.lock:
+            # another thread may have built the same solver in the meantime
+            if key in self.solvers:
+                self.solvers.move_to_end(key)
+                return self.solvers[key]
+            self.solvers[key] = solver
+            self.size += size
+            while self.size > self.max_bytes and len(self.solvers) > 1:
+                evicted = self.solvers.popitem(last=False)[1]
+                self.size -= evicted.nbytes()
+        return solver
+
+    def clear(self):
+        with self.lock:
+            self.solvers.clear()
+            self.size = 0
+
+
+# cache used by solve_discrete_log
+solver_cache = DiscreteLogSolverCache()
+
+
+def solve_discrete_log(group, a, b):
+    """
+    Calculates x such that a^x = b in the given group. Reuses the baby-step table of earlier
+    calls with the same group parameters and a.
+
+    returns: x, such that a^x = b in the given group or None should there be no such x
+
+    arguments:
+            group: The group in which the result will be calculated
+            a: The base of a^x = b
+            b: The result of a^x = b
+    """
+    return solver_cache.get(group, a).solve(b)
@@ -50,6 +50,20 @@ class AbstGroup:
         """
         return 1
 
+    def params(self):
+        """
+        Returns a hashable tuple of the parameters that define the group. Two groups of the same class
+        with equal params must be the same group. Should be overwritten, by default every instance is unique.
+        """
+        return (id(self),)
+
+    def normalize(self, element):
+        """
+        Returns the canonical representation of element, so equal elements can be compared and hashed.
+        Should be overwritten by groups whose elements have more than one representation.
+        """
+        return element
+
 class MultModGroup(AbstGroup):
     """
     Implements a group over multiplication modulo N.
@@ -63,8 +77,8 @@ class MultModGroup(AbstGroup):
         self.N = N
     
     def op(self,a,b):
-        a = a % N
-        b = b % N
+        a = a % self.N
+        b = b % self.N
         return (a*b) % self.N
 
     def exp(self,element, exponent):
@@ -76,6 +90,12 @@ class MultModGroup(AbstGroup):
     def order(self):
         return self.N
 
+    def params(self):
+        return (self.N,)
+
+    def normalize(self, element):
+        return element % self.N
+
 
 class EllCurveGroup:
     """
@@ -162,3 +182,17 @@ class EllCurveGroup:
         out = check_output(["python3", "pyschoof/naive_schoof.py", str(self.N), str(self.a), str(self.   b)])
         return int(out)
 
+    def params(self):
+        """
+        Returns the parameters a, b and N that describe the curve.
+        """
+        return (self.a, self.b, self.N)
+
+    def normalize(self, element):
+        """
+        Returns the point with both coordinates reduced modulo N. The neutral element stays None.
+        """
+        if element == self.neutral_element:
+            return element
+        return (element[0] % self.N, element[1] % self.N)
+
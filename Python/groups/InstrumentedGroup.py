@@ -0,0 +1,61 @@
+import time
+
+from .Groups import AbstGroup
+from ..discreteMath.Instrumentation import InstrumentationRegistry, bit_size
+
+
+class InstrumentedGroup(AbstGroup):
+    """
+    Wraps a group that extends the AbstGroup class and records count, time and operand bit size of
+    every op, exp, inv and order call into a registry. Everything else is delegated to the wrapped group.
+    """
+
+    def __init__(self, group, registry=None):
+        """
+        Wraps group.
+
+        Arguments:
+            group: The group whose calls are recorded (AbstGroup)
+            registry: The registry to record into. A new enabled registry is created if None (InstrumentationRegistry)
+        """
+        self.group = group
+        self.registry = registry if registry is not None else InstrumentationRegistry(enabled=True)
+        self.neutral_element = group.neutral_element
+
+    def __getattr__(self, name):
+        # only called for attributes that are not set on the wrapper, e.g. N of a MultModGroup
+        return getattr(self.group, name)
+
+    def _record(self, name, function, *args):
+        # only called while the registry is enabled, the bit size is calculated from args
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.registry.record(name, time.perf_counter() - start, bit_size(*args))
+
+    def op(self, a, b):
+        if not self.registry.enabled:
+            return self.group.op(a, b)
+        return self._record("op", self.group.op, a, b)
+
+    def exp(self, element, exponent):
+        if not self.registry.enabled:
+            return self.group.exp(element, exponent)
+        return self._record("exp", self.group.exp, element, exponent)
+
+    def inv(self, element):
+        if not self.registry.enabled:
+            return self.group.inv(element)
+        return self._record("inv", self.group.inv, element)
+
+    def order(self):
+        if not self.registry.enabled:
+            return self.group.order()
+        return self._record("order", self.group.order)
+
+    def params(self):
+        return self.group.params()
+
+    def normalize(self, element):
+        return self.group.normalize(element)
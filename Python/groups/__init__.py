@@ -1,2 +1,4 @@
 from .Groups import *
 from .BabyStepGiantStep import *
+from .InstrumentedGroup import *
+from .DiscreteLogSolver import *
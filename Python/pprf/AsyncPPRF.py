@@ -0,0 +1,156 @@
+import asyncio
+
+from .PPRF import PuncturedException
+
+
+class AsyncPPRF:
+    """
+    An asyncio front-end for an OuterPPRF. The exponentations run in an executor so they do not block
+    the event loop.
+
+    Every innerPPRF has its own lock, which orders evaluations and punctures of that innerPPRF the
+    way they were called. Concurrent evaluations of the same value share one future. Concurrent
+    evaluations on the same innerPPRF are collected into one batch and calculated with a single
+    call of InnerPPRF.evaluate_batch.
+    """
+
+    def __init__(self, pprf, executor=None, batch_window=0):
+        """
+        Wraps pprf.
+
+        Arguments:
+            pprf: The OuterPPRF that evaluates and punctures (OuterPPRF)
+            executor: The executor the exponentations run in. The default executor of the loop if None
+            batch_window: Seconds a batch waits for more evaluations before it is calculated. With 0
+                          only evaluations of the same event loop iteration are batched (float)
+        """
+        self.pprf = pprf
+        self.executor = executor
+        self.batch_window = batch_window
+        # one lock per innerPPRF, created lazily as they are bound to the running loop
+        self.locks = dict()
+        # innerPPRF index -> {inner value -> future} of the batch that waits to be calculated
+        self.pending = dict()
+        # value -> future of every evaluation that is not finished yet
+        self.inflight = dict()
+        # keep references so the batch tasks are not garbage collected while they run
+        self.tasks = set()
+
+    def _lock(self, innerpprf):
+        try:
+            return self.locks[innerpprf]
+        except KeyError:
+            lock = self.locks[innerpprf] = asyncio.Lock()
+            return lock
+
+    async def evaluate(self, x):
+        """
+        Returns the y in Y of x in X of the PPRF F: X->Y. It will return an exception should x be a punctured value
+        or not in the defined range of the PPRF F.
+
+        Arguments:
+            x: The value for which F(x) will be returned
+
+        Exception:
+            PuncturedException: Should F(x) be punctured.
+            ValueError: Should x not be member of X in F: X->Y
+        """
+        if x < 0 or x >= self.pprf.values:
+            raise ValueError
+        try:
+            future = self.inflight[x]
+        except KeyError:
+            loop = asyncio.get_running_loop()
+            future = self.inflight[x] = loop.create_future()
+            future.add_done_callback(lambda f: self._done(x, f))
+
+            # Choose the right PPRF and its index
+            innerpprf = x // 232
+            innerpprf_index = x % 232
+            try:
+                self.pending[innerpprf][innerpprf_index] = future
+            except KeyError:
+                batch = self.pending[innerpprf] = {innerpprf_index: future}
+                self._start(self._flush_later(innerpprf, batch))
+        # one caller being cancelled must not cancel the evaluation for the others
+        return await asyncio.shield(future)
+
+    async def puncture(self, x):
+        """
+        Punctures the PPRF F on value x. Evaluations that were called before are calculated first.
+        The puncture is done even if the caller is cancelled, as evaluations already wait for it.
+
+        Arguments:
+            x: The value for which F will be punctured.
+
+        Exception:
+            ValueError: Should x not be member of X in F: X->Y
+        """
+        if x < 0 or x >= self.pprf.values:
+            raise ValueError
+        innerpprf = x // 232
+        # take the waiting batch before waiting for the lock, so evaluations called after this
+        # puncture are part of a later batch and do not share the future of an earlier evaluation
+        batch = self.pending.pop(innerpprf, None)
+        self.inflight.pop(x, None)
+        # only this puncture can resolve the taken batch, so it runs in its own task that a
+        # cancelled caller can not stop half way
+        await asyncio.shield(self._start(self._puncture(innerpprf, batch, x)))
+
+    async def _puncture(self, innerpprf, batch, x):
+        async with self._lock(innerpprf):
+            if batch:
+                await self._calculate(innerpprf, batch)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.pprf.puncture, x)
+
+    def _start(self, coroutine):
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def _done(self, x, future):
+        # a puncture may already have replaced the future of x
+        if self.inflight.get(x) is future:
+            del self.inflight[x]
+
+    async def _flush_later(self, innerpprf, batch):
+        await asyncio.sleep(self.batch_window)
+        if self.pending.get(innerpprf) is not batch:
+            # a puncture already took the batch, a newer batch is flushed by its own task
+            return
+        del self.pending[innerpprf]
+        async with self._lock(innerpprf):
+            await self._calculate(innerpprf, batch)
+
+    async def _calculate(self, innerpprf, batch):
+        """
+        Calculates a batch of evaluations and resolves their futures. Must hold the lock of the innerPPRF.
+        """
+        try:
+            inner = self.pprf.innerPPRFs[innerpprf]
+            xs = []
+            for x, future in batch.items():
+                if x in inner.punctures:
+                    future.set_exception(PuncturedException())
+                else:
+                    xs.append(x)
+            if not xs:
+                return
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(self.executor, inner.evaluate_batch, xs)
+            except Exception as e:
+                for x in xs:
+                    if not batch[x].done():
+                        batch[x].set_exception(e)
+                return
+            for x in xs:
+                if not batch[x].done():
+                    batch[x].set_result(results[x])
+        finally:
+            # should the calculation itself be cancelled, nobody else would resolve the futures
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
@@ -103,6 +103,7 @@ class InnerPPRF:
             outerPPRF: the outerPPRF with the modulo value. needed for this innerPPRF.
         """
         self.outerPPRF = outerPPRF
+        self.punctures = []
 
         self.g = random.randint(0,self.outerPPRF.N-1)
 
@@ -128,6 +129,68 @@ class InnerPPRF:
             if (j!=x) and not (j in self.punctures):
                 mult *= self.outerPPRF.primes[j] % self.outerPPRF.N
         ret = square_and_multiply(self.g,self.outerPPRF.N,mult)
+        return self._hash(ret)
+
+    def evaluate_batch(self,xs):
+        """
+        Evaluates the PPRF on all values in xs at once. Instead of one exponentation with the product of
+        almost all primes per value, g is raised once to the product of all primes that none of the values
+        needs to leave out. The values are then split in halves and the result of each half is raised to the
+        primes of the other half, until only one value is left. This needs exponents of about k*log(k) primes
+        in total for k values instead of k*232.
+
+        Arguments:
+            xs: The values for which F(x) will be returned (iterable of int)
+
+        Returns:
+            A dict that maps every x in xs to F(x)
+
+        Exception:
+            PuncturedException: Should F(x) be punctured for any x in xs.
+            ValueError: Should any x in xs not be member of X in F: X->Y
+        """
+        xs = list(set(xs))
+        for x in xs:
+            if x in self.punctures:
+                raise PuncturedException
+            if x<0 or x>231:
+                raise ValueError
+
+        primes = self.outerPPRF.primes
+        mult = 1
+        for j in range(len(primes)):
+            if not (j in xs) and not (j in self.punctures):
+                mult *= primes[j]
+        ret = dict()
+        if xs:
+            self._evaluate_halves(square_and_multiply(self.g,self.outerPPRF.N,mult),xs,ret)
+        return ret
+
+    def _evaluate_halves(self,base,xs,ret):
+        """
+        Writes F(x) for all x in xs into ret. base is g raised to all primes that are not punctured and not in xs.
+        """
+        if len(xs)==1:
+            ret[xs[0]] = self._hash(base)
+            return
+        N = self.outerPPRF.N
+        primes = self.outerPPRF.primes
+        left = xs[:len(xs)//2]
+        right = xs[len(xs)//2:]
+        # the values of one half need the primes of the other half in their exponent
+        mult = 1
+        for j in right:
+            mult *= primes[j]
+        self._evaluate_halves(square_and_multiply(base,N,mult),left,ret)
+        mult = 1
+        for j in left:
+            mult *= primes[j]
+        self._evaluate_halves(square_and_multiply(base,N,mult),right,ret)
+
+    def _hash(self,ret):
+        """
+        Hashes the group element ret to the output of the PPRF.
+        """
         hash = SHAKE256.new()
         hash.update(ret.to_bytes(int(self.outerPPRF.secpem/8),'little'))
         return hash.read(int(self.outerPPRF.secpem/8))
@@ -148,7 +211,7 @@ class InnerPPRF:
         if x<0 or x>231:
             raise ValueError
 
-        self.g = sqm.square_and_multiply(self.g,self.outerPPRF.N,self.outerPPRF.primes[x])
+        self.g = square_and_multiply(self.g,self.outerPPRF.N,self.outerPPRF.primes[x])
         self.punctures.append(x)
         return
 
@@ -190,6 +253,7 @@ class OuterPPRF(AbstPPRF):
         key = RSA.generate(self.secpem)
         self.N = key.n
         
+        self.innerPPRFs = []
         for i in range(int(values/232)):
             self.innerPPRFs.append(InnerPPRF(self))
     
@@ -205,8 +269,8 @@ class OuterPPRF(AbstPPRF):
             PuncturedException: Should F(x) be punctured.
             ValueError: Should x not be member of X in F: X->Y
         """
-        if x >= self.values:
-            ValueError
+        if x < 0 or x >= self.values:
+            raise ValueError
         
         # Choose the right PPRF and its index
         innerpprf = int(x / 232);
@@ -224,11 +288,11 @@ class OuterPPRF(AbstPPRF):
         Exception:
             ValueError: Should x not be member of X in F: X->Y
         """
-        if x >= self.values:
+        if x < 0 or x >= self.values:
             raise ValueError
         
         # Choose the right PPRF and its index
         innerpprf = int(x / 232);
         innerpprf_index = x % 232;
-        return self.innerPPRFs[innerpprf].puncture(x)
+        return self.innerPPRFs[innerpprf].puncture(innerpprf_index)
     
\ No newline at end of file
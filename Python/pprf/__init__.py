@@ -1 +1,2 @@
 from .PPRF import *
+from .AsyncPPRF import *
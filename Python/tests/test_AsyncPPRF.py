@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+
+from Python.pprf.PPRF import OuterPPRF, PuncturedException
+from Python.pprf.AsyncPPRF import AsyncPPRF
+
+
+class AsyncPPRFTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # F(x) does not change when other values are punctured, so the expected values can be taken first
+        self.pprf = OuterPPRF(2048, 232)
+        self.expected = {x: self.pprf.evaluate(x) for x in (3, 5, 7)}
+
+    async def test_coalesces_and_batches(self):
+        asyncpprf = AsyncPPRF(self.pprf)
+        results = await asyncio.gather(*(asyncpprf.evaluate(x) for x in (3, 5, 3, 7)))
+        self.assertEqual(results, [self.expected[3], self.expected[5], self.expected[3], self.expected[7]])
+        self.assertEqual(asyncpprf.inflight, {})
+        self.assertEqual(asyncpprf.pending, {})
+
+    async def test_puncture_orders_evaluations(self):
+        asyncpprf = AsyncPPRF(self.pprf)
+        before, _, after = await asyncio.gather(asyncpprf.evaluate(3), asyncpprf.puncture(3), asyncpprf.evaluate(3),
+                                                return_exceptions=True)
+        self.assertEqual(before, self.expected[3])
+        self.assertIsInstance(after, PuncturedException)
+
+    async def test_cancelled_puncture_resolves_taken_batch(self):
+        asyncpprf = AsyncPPRF(self.pprf, batch_window=10)
+        lock = asyncpprf._lock(0)
+        await lock.acquire()
+        evaluation = asyncio.create_task(asyncpprf.evaluate(3))
+        await asyncio.sleep(0)
+        puncture = asyncio.create_task(asyncpprf.puncture(1))
+        await asyncio.sleep(0)
+        # the puncture took the batch of evaluate(3) and waits for the lock
+        self.assertEqual(asyncpprf.pending, {})
+        puncture.cancel()
+        await asyncio.sleep(0)
+        lock.release()
+
+        self.assertEqual(await asyncio.wait_for(evaluation, 30), self.expected[3])
+        self.assertEqual(await asyncio.wait_for(asyncpprf.evaluate(3), 30), self.expected[3])
+        # the puncture is still done
+        with self.assertRaises(PuncturedException):
+            await asyncio.wait_for(asyncpprf.evaluate(1), 30)
+
+    async def test_cancelled_caller_does_not_cancel_shared_evaluation(self):
+        asyncpprf = AsyncPPRF(self.pprf)
+        first = asyncio.create_task(asyncpprf.evaluate(5))
+        second = asyncio.create_task(asyncpprf.evaluate(5))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await asyncio.wait_for(second, 30), self.expected[5])
+
+    async def test_flush_keeps_window_of_newer_batch(self):
+        asyncpprf = AsyncPPRF(self.pprf, batch_window=0.5)
+        evaluation = asyncio.create_task(asyncpprf.evaluate(5))
+        await asyncio.sleep(0)
+        # takes the first batch, whose flush task still wakes up after 0.5 seconds
+        await asyncpprf.puncture(6)
+        self.assertEqual(await evaluation, self.expected[5])
+        await asyncio.sleep(0.3)
+        newer = asyncio.create_task(asyncpprf.evaluate(7))
+        await asyncio.sleep(0.25)
+        # the first flush task woke up but must not have taken the newer batch
+        self.assertIn(7, asyncpprf.pending[0])
+        self.assertEqual(await asyncio.wait_for(newer, 30), self.expected[7])
+
+
+if __name__ == "__main__":
+    unittest.main()